@@ -7,19 +7,84 @@ Author: HFRPP Team
 Date: 2026-02-24
 """
 
+import functools
+import logging
+import math
+import os
 import numpy as np
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, List, Optional, Tuple
 import sys
 
+logger = logging.getLogger(__name__)
+
 # Try NeuralFoil
 try:
     from neuralfoil import neuralfoiled
     NEURALFOIL_AVAILABLE = True
 except ImportError:
     NEURALFOIL_AVAILABLE = False
-    print("Warning: NeuralFoil not available, using estimated values")
+    logger.warning("NeuralFoil not available, using estimated values")
+
+
+def _naca4_surfaces(x: np.ndarray, m: float, p: float,
+                    t: float) -> Tuple[np.ndarray, np.ndarray,
+                                       np.ndarray, np.ndarray]:
+    """NumPy NACA 4-digit kernel: upper/lower surfaces at stations x"""
+    # Thickness distribution
+    yt = 5 * t * (0.2969 * np.sqrt(x) - 0.1260 * x - 0.3516 * x**2 +
+                  0.2843 * x**3 - 0.1015 * x**4)
+
+    # Camber line
+    if m == 0:  # Symmetric
+        yc = np.zeros_like(x)
+        dyc_dx = np.zeros_like(x)
+    else:
+        # Evaluate each piece only on its own slice of x
+        k_fwd = m / p**2 if p > 0 else 0.0
+        k_aft = m / (1-p)**2
+        yc = np.empty_like(x)
+        dyc_dx = np.empty_like(x)
+        fwd = x < p
+        aft = ~fwd
+        xf = x[fwd]
+        xb = x[aft]
+        yc[fwd] = k_fwd * (2*p*xf - xf**2)
+        yc[aft] = k_aft * ((1-2*p) + 2*p*xb - xb**2)
+        dyc_dx[fwd] = 2*k_fwd * (p - xf)
+        dyc_dx[aft] = 2*k_aft * (p - xb)
+
+    # Upper and lower surfaces
+    theta = np.arctan(dyc_dx)
+    xu = x - yt * np.sin(theta)
+    yu = yc + yt * np.cos(theta)
+    xl = x + yt * np.sin(theta)
+    yl = yc - yt * np.cos(theta)
+
+    return xu, yu, xl, yl
+
+
+# Literature values for common airfoils (Abbott & von Doenhoff, etc.)
+_LITERATURE_DB = MappingProxyType({
+    "NACA_0012": {"CL_MAX": 1.30, "CD_0": 0.0055, "ALPHA_STALL": 15.0, "CM_0": 0.0},
+    "NACA_0015": {"CL_MAX": 1.25, "CD_0": 0.0062, "ALPHA_STALL": 14.5, "CM_0": 0.0},
+    "NACA_2412": {"CL_MAX": 1.50, "CD_0": 0.0058, "ALPHA_STALL": 15.0, "CM_0": -0.048},
+    "NACA_2415": {"CL_MAX": 1.45, "CD_0": 0.0065, "ALPHA_STALL": 14.5, "CM_0": -0.050},
+    "NACA_4412": {"CL_MAX": 1.65, "CD_0": 0.0062, "ALPHA_STALL": 14.0, "CM_0": -0.085},
+    "NACA_4415": {"CL_MAX": 1.60, "CD_0": 0.0070, "ALPHA_STALL": 13.5, "CM_0": -0.090},
+    "NACA_4418": {"CL_MAX": 1.55, "CD_0": 0.0080, "ALPHA_STALL": 13.0, "CM_0": -0.095},
+    "NACA_6412": {"CL_MAX": 1.85, "CD_0": 0.0075, "ALPHA_STALL": 13.0, "CM_0": -0.125},
+    "Skywalker_X8": {"CL_MAX": 1.50, "CD_0": 0.021, "ALPHA_STALL": 14.0, "CM_0": -0.035},
+    "Eppler_387": {"CL_MAX": 1.40, "CD_0": 0.007, "ALPHA_STALL": 12.5, "CM_0": -0.060},
+    "Eppler_214": {"CL_MAX": 1.55, "CD_0": 0.0068, "ALPHA_STALL": 13.0, "CM_0": -0.075},
+    "MH_60": {"CL_MAX": 1.35, "CD_0": 0.006, "ALPHA_STALL": 12.0, "CM_0": -0.045},
+    "MH_78": {"CL_MAX": 1.50, "CD_0": 0.0068, "ALPHA_STALL": 12.5, "CM_0": -0.070},
+    "LS_0413": {"CL_MAX": 1.60, "CD_0": 0.0068, "ALPHA_STALL": 14.5, "CM_0": -0.085},
+    "Clark_Y": {"CL_MAX": 1.45, "CD_0": 0.0065, "ALPHA_STALL": 15.0, "CM_0": -0.058},
+})
 
 
 class AirfoilAnalyzer:
@@ -73,38 +138,27 @@ class AirfoilAnalyzer:
         beta = np.linspace(0, np.pi, n_points)
         x = (1 - np.cos(beta)) / 2
 
-        # Thickness distribution
-        yt = 5 * t * (0.2969 * np.sqrt(x) - 0.1260 * x - 0.3516 * x**2 +
-                      0.2843 * x**3 - 0.1015 * x**4)
+        # Single airfoil contour: upper TE -> LE, then lower LE -> TE
+        x_coord = np.empty(2*n_points - 1)
+        y_coord = np.empty(2*n_points - 1)
 
-        # Camber line
-        if m == 0:  # Symmetric
-            yc = np.zeros_like(x)
-            dyc_dx = np.zeros_like(x)
-        else:
-            yc = np.where(x < p,
-                         m / p**2 * (2*p*x - x**2),
-                         m / (1-p)**2 * ((1-2*p) + 2*p*x - x**2))
-            dyc_dx = np.where(x < p,
-                            2*m/p**2 * (p - x),
-                            2*m/(1-p)**2 * (p - x))
-
-        # Upper and lower surfaces
-        theta = np.arctan(dyc_dx)
-        xu = x - yt * np.sin(theta)
-        yu = yc + yt * np.cos(theta)
-        xl = x + yt * np.sin(theta)
-        yl = yc - yt * np.cos(theta)
-
-        # Combine into single airfoil coordinates
-        x_coord = np.concatenate([xu[::-1], xl[1:]])
-        y_coord = np.concatenate([yu[::-1], yl[1:]])
+        xu, yu, xl, yl = _naca4_surfaces(x, m, p, t)
+        x_coord[:n_points] = xu[::-1]
+        x_coord[n_points:] = xl[1:]
+        y_coord[:n_points] = yu[::-1]
+        y_coord[n_points:] = yl[1:]
 
         return x_coord, y_coord
 
     def __init__(self):
         """Initialize airfoil analyzer"""
-        self.results_cache = {}
+        self._lit_cache: Dict[str, Dict] = {}  # name -> literature result
+        self._neural_cache: Dict[Tuple[str, float], Dict] = {}  # (name, Re)
+        self.results_cache = self._neural_cache  # backward-compatible alias
+
+        # NeuralFoil sweep grid, shared read-only across calls and threads
+        self._alphas = np.linspace(-5, 20, 100)
+        self._alphas.setflags(write=False)
 
     def analyze_airfoil(self, airfoil_name: str,
                        reynolds: float = DEFAULT_REYNOLDS) -> Dict:
@@ -118,29 +172,26 @@ class AirfoilAnalyzer:
         Returns:
             Dict with CL_MAX, CD_0, ALPHA_STALL, etc.
         """
-        # Check cache
-        cache_key = f"{airfoil_name}_{reynolds:.1e}"
-        if cache_key in self.results_cache:
-            return self.results_cache[cache_key]
-
-        result = {
-            "airfoil": airfoil_name,
-            "Reynolds": reynolds,
-            "method": None,
-            "CL_MAX": None,
-            "CD_0": None,
-            "ALPHA_STALL": None,
-            "CM_0": None,
-            "confidence": "low"
-        }
-
-        # PRIORITY: Literature values first (highest confidence)
-        lit_result = self._get_literature_values(airfoil_name)
-        if lit_result.get("CL_MAX") is not None:
-            result.update(lit_result)
-            result["confidence"] = "high"
-            self.results_cache[cache_key] = result
-            return result
+        # Literature values do not depend on Reynolds: cache them by name
+        lit = self._lit_cache.get(airfoil_name)
+        if lit is None:
+            lit_result = self._get_literature_values(airfoil_name)
+            if lit_result.get("CL_MAX") is not None:
+                lit = self._new_result(airfoil_name, reynolds)
+                lit.update(lit_result)
+                lit["confidence"] = "high"
+                self._lit_cache[airfoil_name] = lit
+        if lit is not None:
+            if lit["Reynolds"] == reynolds:
+                return lit
+            return {**lit, "Reynolds": reynolds}
+
+        # Reynolds-sensitive path: cache by (name, quantized Re)
+        cache_key = (airfoil_name, _quantize_reynolds(reynolds))
+        if cache_key in self._neural_cache:
+            return self._neural_cache[cache_key]
+
+        result = self._new_result(airfoil_name, reynolds)
 
         # Try NeuralFoil second
         if NEURALFOIL_AVAILABLE:
@@ -148,18 +199,32 @@ class AirfoilAnalyzer:
                 result_neural = self._analyze_with_neuralfoil(airfoil_name, reynolds)
                 if result_neural.get("CL_MAX") is not None:
                     result.update(result_neural)
-                    self.results_cache[cache_key] = result
+                    self._neural_cache[cache_key] = result
                     return result
             except Exception as e:
-                print(f"NeuralFoil failed for {airfoil_name}: {e}")
+                logger.warning("NeuralFoil failed for %s: %s", airfoil_name, e)
 
         # Fallback to coordinate-based analysis
         result_coord = self._analyze_from_coordinates(airfoil_name, reynolds)
         result.update(result_coord)
 
-        self.results_cache[cache_key] = result
+        self._neural_cache[cache_key] = result
         return result
 
+    @staticmethod
+    def _new_result(airfoil_name: str, reynolds: float) -> Dict:
+        """Empty result record for an airfoil at a Reynolds number"""
+        return {
+            "airfoil": airfoil_name,
+            "Reynolds": reynolds,
+            "method": None,
+            "CL_MAX": None,
+            "CD_0": None,
+            "ALPHA_STALL": None,
+            "CM_0": None,
+            "confidence": "low"
+        }
+
     def _analyze_with_neuralfoil(self, airfoil_name: str,
                                  reynolds: float) -> Dict:
         """Analyze using NeuralFoil"""
@@ -179,58 +244,40 @@ class AirfoilAnalyzer:
             # NeuralFoil 0.3+ API
             af = neuralfoiled(x, y)
             # Get aerodynamic coefficients at various alphas
-            alphas = np.linspace(-5, 20, 100)
-
-            cl_list = []
-            cd_list = []
-
-            for alpha in alphas:
-                coef = af.get_coefficients(alpha=alpha, Re=reynolds)
-                cl_list.append(coef['cl'])
-                cd_list.append(coef['cd'])
-
-            cl_list = np.array(cl_list)
-            cd_list = np.array(cd_list)
-
-            # Find CL_MAX
-            result["CL_MAX"] = float(np.max(cl_list))
-            result["ALPHA_STALL"] = float(alphas[np.argmax(cl_list)])
+            alphas = self._alphas
+
+            # Single batched evaluation over the whole alpha sweep
+            # (Re must match alpha length for the vectorized API; allocated
+            # per call so concurrent analyses cannot overwrite each other)
+            coef = af.get_coefficients(alpha=alphas,
+                                       Re=np.full_like(alphas, reynolds))
+            cl_list = np.asarray(coef['cl'])
+            cd_list = np.asarray(coef['cd'])
+
+            # Find CL_MAX (sub-grid peak from a 3-point parabola)
+            alpha_stall, cl_max = _refine_extremum(alphas, cl_list,
+                                                   int(np.argmax(cl_list)))
+            result["CL_MAX"] = float(cl_max)
+            result["ALPHA_STALL"] = float(alpha_stall)
 
             # Find CD_0 (minimum drag)
-            result["CD_0"] = float(np.min(cd_list))
+            _, cd_0 = _refine_extremum(alphas, cd_list, int(np.argmin(cd_list)))
+            result["CD_0"] = float(cd_0)
 
             # CM_0 (moment at alpha=0, interpolated)
-            if 0 in alphas:
-                idx_0 = list(alphas).index(0)
-            else:
-                idx_0 = np.argmin(np.abs(alphas))
+            idx_0 = int(np.argmin(np.abs(alphas)))
             # result["CM_0"] would need moment data
 
         except Exception as e:
-            print(f"NeuralFoil analysis error: {e}")
+            logger.warning("NeuralFoil analysis error: %s", e)
             result["CL_MAX"] = None
             result["CD_0"] = None
 
         return result
 
     def _get_coordinates(self, airfoil_name: str) -> Tuple[np.ndarray, np.ndarray]:
-        """Get airfoil coordinates (generate or load)"""
-        # Check if it's a NACA 4-digit
-        if airfoil_name.startswith("NACA_") and len(airfoil_name) >= 8:
-            code = airfoil_name.replace("NACA_", "")
-            if code.isdigit() and len(code) == 4:
-                return self.naca4_generator(code)
-
-        # Skywalker X8 uses NACA 4415
-        if airfoil_name == "Skywalker_X8":
-            return self.naca4_generator("4415")
-
-        # For other airfoils, would need to load .dat files
-        # Placeholder: return thin airfoil
-        x = np.linspace(0, 1, 100)
-        y = 0.06 * (0.2969 * np.sqrt(x) - 0.1260 * x - 0.3516 * x**2 +
-                     0.2843 * x**3 - 0.1015 * x**4)  # 6% thick
-        return x, y
+        """Get airfoil coordinates (generate or load, cached per name)"""
+        return _coords_for(airfoil_name)
 
     def _analyze_from_coordinates(self, airfoil_name: str,
                                   reynolds: float) -> Dict:
@@ -264,34 +311,10 @@ class AirfoilAnalyzer:
 
     def _get_literature_values(self, airfoil_name: str) -> Dict:
         """Get values from literature (Abbott & von Doenhoff, etc.)"""
-        # Literature values for common airfoils
-        literature_db = {
-            "NACA_0012": {"CL_MAX": 1.30, "CD_0": 0.0055, "ALPHA_STALL": 15.0, "CM_0": 0.0},
-            "NACA_0015": {"CL_MAX": 1.25, "CD_0": 0.0062, "ALPHA_STALL": 14.5, "CM_0": 0.0},
-            "NACA_2412": {"CL_MAX": 1.50, "CD_0": 0.0058, "ALPHA_STALL": 15.0, "CM_0": -0.048},
-            "NACA_2415": {"CL_MAX": 1.45, "CD_0": 0.0065, "ALPHA_STALL": 14.5, "CM_0": -0.050},
-            "NACA_4412": {"CL_MAX": 1.65, "CD_0": 0.0062, "ALPHA_STALL": 14.0, "CM_0": -0.085},
-            "NACA_4415": {"CL_MAX": 1.60, "CD_0": 0.0070, "ALPHA_STALL": 13.5, "CM_0": -0.090},
-            "NACA_4418": {"CL_MAX": 1.55, "CD_0": 0.0080, "ALPHA_STALL": 13.0, "CM_0": -0.095},
-            "NACA_6412": {"CL_MAX": 1.85, "CD_0": 0.0075, "ALPHA_STALL": 13.0, "CM_0": -0.125},
-            "Skywalker_X8": {"CL_MAX": 1.50, "CD_0": 0.021, "ALPHA_STALL": 14.0, "CM_0": -0.035},
-            "Eppler_387": {"CL_MAX": 1.40, "CD_0": 0.007, "ALPHA_STALL": 12.5, "CM_0": -0.060},
-            "Eppler_214": {"CL_MAX": 1.55, "CD_0": 0.0068, "ALPHA_STALL": 13.0, "CM_0": -0.075},
-            "MH_60": {"CL_MAX": 1.35, "CD_0": 0.006, "ALPHA_STALL": 12.0, "CM_0": -0.045},
-            "MH_78": {"CL_MAX": 1.50, "CD_0": 0.0068, "ALPHA_STALL": 12.5, "CM_0": -0.070},
-            "LS_0413": {"CL_MAX": 1.60, "CD_0": 0.0068, "ALPHA_STALL": 14.5, "CM_0": -0.085},
-            "Clark_Y": {"CL_MAX": 1.45, "CD_0": 0.0065, "ALPHA_STALL": 15.0, "CM_0": -0.058},
-        }
-
-        result = literature_db.get(airfoil_name, {})
-        if result:
-            result["method"] = "literature"
-            result["confidence"] = "high"
-        else:
-            result["method"] = "unknown"
-            result["confidence"] = "none"
-
-        return result
+        hit = _LITERATURE_DB.get(airfoil_name)
+        if hit:
+            return {**hit, "method": "literature", "confidence": "high"}
+        return {"method": "unknown", "confidence": "none"}
 
     def analyze_all(self, airfoil_list: List[str],
                    reynolds: float = DEFAULT_REYNOLDS) -> Dict[str, Dict]:
@@ -304,11 +327,29 @@ class AirfoilAnalyzer:
 
         Returns:
             Dict of {airfoil_name: result_dict}
+
+        Literature hits are resolved inline; the remaining airfoils
+        (NeuralFoil / coordinate analysis) run on a thread pool.
         """
         results = {}
-        for airfoil in airfoil_list:
-            results[airfoil] = self.analyze_airfoil(airfoil, reynolds)
-        return results
+        pending = []
+        for airfoil in dict.fromkeys(airfoil_list):
+            if airfoil in self._lit_cache or airfoil in _LITERATURE_DB:
+                results[airfoil] = self.analyze_airfoil(airfoil, reynolds)
+            else:
+                pending.append(airfoil)
+
+        if len(pending) > 1:
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+                computed = pool.map(
+                    lambda name: self.analyze_airfoil(name, reynolds), pending)
+                results.update(zip(pending, computed))
+        else:
+            for airfoil in pending:
+                results[airfoil] = self.analyze_airfoil(airfoil, reynolds)
+
+        # Preserve caller order
+        return {airfoil: results[airfoil] for airfoil in airfoil_list}
 
     def compare_with_uav_database(self, uav_db_path: str) -> Dict:
         """
@@ -333,6 +374,65 @@ class AirfoilAnalyzer:
         }
 
 
+@functools.lru_cache(maxsize=64)
+def _coords_for(airfoil_name: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Airfoil coordinates by name (deterministic, so safe to memoize)"""
+    # Check if it's a NACA 4-digit
+    if airfoil_name.startswith("NACA_") and len(airfoil_name) >= 8:
+        code = airfoil_name.replace("NACA_", "")
+        if code.isdigit() and len(code) == 4:
+            x, y = AirfoilAnalyzer.naca4_generator(code)
+            return _read_only(x, y)
+
+    # Skywalker X8 uses NACA 4415
+    if airfoil_name == "Skywalker_X8":
+        x, y = AirfoilAnalyzer.naca4_generator("4415")
+        return _read_only(x, y)
+
+    # For other airfoils, would need to load .dat files
+    # Placeholder: return thin airfoil
+    x = np.linspace(0, 1, 100)
+    y = 0.06 * (0.2969 * np.sqrt(x) - 0.1260 * x - 0.3516 * x**2 +
+                 0.2843 * x**3 - 0.1015 * x**4)  # 6% thick
+    return _read_only(x, y)
+
+
+def _quantize_reynolds(reynolds: float) -> float:
+    """Round Reynolds number to 2 significant figures for cache keys"""
+    if reynolds <= 0:
+        return reynolds
+    return round(reynolds, 1 - math.floor(math.log10(reynolds)))
+
+
+def _refine_extremum(x: np.ndarray, y: np.ndarray, k: int) -> Tuple[float, float]:
+    """
+    Refine a sampled extremum with a parabola through its neighbours
+
+    Args:
+        x: Uniformly spaced sample locations
+        y: Sampled values
+        k: Index of the discrete maximum or minimum
+
+    Returns:
+        (x_peak, y_peak) of the fitted parabola, or the raw sample at the
+        grid edges and for degenerate (flat) neighbourhoods
+    """
+    if 0 < k < len(y) - 1:
+        y0, y1, y2 = y[k-1], y[k], y[k+1]
+        denom = y0 - 2*y1 + y2
+        if denom != 0:
+            shift = 0.5 * (y0 - y2) / denom
+            return x[k] + shift * (x[1] - x[0]), y1 - 0.25 * (y0 - y2) * shift
+    return x[k], y[k]
+
+
+def _read_only(x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Freeze cached coordinate arrays so callers cannot corrupt the cache"""
+    x.setflags(write=False)
+    y.setflags(write=False)
+    return x, y
+
+
 # Example usage
 if __name__ == "__main__":
     analyzer = AirfoilAnalyzer()
@@ -11,10 +11,18 @@ Author: HFRPP Team
 Date: 2026-02-24
 """
 
-import json
+import logging
+import numpy as np
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 
+try:
+    from .json_cache import load_json
+except ImportError:  # Imported as a top-level module (src/ on sys.path)
+    from json_cache import load_json
+
+logger = logging.getLogger(__name__)
+
 # ESC database path
 ESC_DB_PATH = Path(__file__).parent / "esc_database_v2.json"
 
@@ -39,23 +47,21 @@ class ESCDatabase:
         self._build_indexes()
 
     def _load_database(self) -> Dict:
-        """Load ESC database from JSON"""
+        """Load ESC database from JSON (parse cached by json_cache)"""
         try:
-            with open(self.db_path, 'r') as f:
-                data = json.load(f)
-                return data['ESC_Database']
+            data = load_json(self.db_path)
+            return data['ESC_Database']
         except FileNotFoundError:
-            print(f"Warning: ESC database not found at {self.db_path}")
+            logger.warning("ESC database not found at %s", self.db_path)
             return {}
         except KeyError:
-            print(f"Warning: Invalid ESC database format")
+            logger.warning("Invalid ESC database format")
             return {}
 
     def _build_indexes(self):
         """Build lookup indexes for fast queries"""
         self.by_current = {}  # current_cont -> list of ESCs
         self.by_size = {}     # size_class -> list of ESCs
-        self.by_cells = {}    # cell_count -> list of ESCs
         self.by_bec = {}      # has_bec -> list of ESCs
 
         for esc_id, esc in self.esc_db.items():
@@ -71,14 +77,6 @@ class ESCDatabase:
                 self.by_size[size] = []
             self.by_size[size].append(esc_id)
 
-            # Index by cell compatibility
-            cells_min = esc.get('CELLS_MIN', 0)
-            cells_max = esc.get('CELLS_MAX', 0)
-            for c in range(cells_min, cells_max + 1):
-                if c not in self.by_cells:
-                    self.by_cells[c] = []
-                self.by_cells[c].append(esc_id)
-
             # Index by BEC availability
             has_bec = esc.get('BEC_VOLTAGE', 0) > 0
             bec_key = 'with_bec' if has_bec else 'opto_only'
@@ -86,6 +84,34 @@ class ESCDatabase:
                 self.by_bec[bec_key] = []
             self.by_bec[bec_key].append(esc_id)
 
+        # Structure-of-arrays view of the selection fields (database order)
+        # Cell compatibility is kept as (CELLS_MIN, CELLS_MAX) intervals
+        self._ids = np.array(list(self.esc_db), dtype=object)
+        self._current = self._field_array('CONT_CURRENT', 0)
+        self._weight = self._field_array('WEIGHT', 0)
+        self._eff = self._field_array('EFFICIENCY', 0.90)
+        self._cost = self._field_array('COST', 100)
+        self._bec_v = self._field_array('BEC_VOLTAGE', 0)
+        self._cmin = self._field_array('CELLS_MIN', 0, dtype=int)
+        self._cmax = self._field_array('CELLS_MAX', 0, dtype=int)
+
+    def _field_array(self, key: str, default, dtype=float) -> np.ndarray:
+        """Collect one ESC field into a contiguous array"""
+        return np.fromiter((esc.get(key, default) for esc in self.esc_db.values()),
+                           dtype=dtype, count=len(self.esc_db))
+
+    def compatible_cell_mask(self, cells: int) -> np.ndarray:
+        """
+        Boolean mask of ESCs supporting the given battery cell count
+
+        Args:
+            cells: Battery cell count
+
+        Returns:
+            Boolean array aligned with the ESC database order
+        """
+        return (self._cmin <= cells) & (cells <= self._cmax)
+
     def get_compatible_escs(self,
                            motor_current: float,
                            battery_cells: int,
@@ -103,37 +129,31 @@ class ESCDatabase:
         Returns:
             List of compatible ESC IDs
         """
+        mask = self._compatibility_mask(motor_current, battery_cells,
+                                        weight_limit, require_bec)
+        return self._ids[mask].tolist()
+
+    def _compatibility_mask(self,
+                            motor_current: float,
+                            battery_cells: int,
+                            weight_limit: Optional[float],
+                            require_bec: bool) -> np.ndarray:
+        """Boolean mask over the field arrays of ESCs passing all checks"""
         required_current = motor_current * (1 + self.SAFETY_MARGIN)
-        compatible = []
 
-        for esc_id, esc in self.esc_db.items():
-            # Current check
-            if esc.get('CONT_CURRENT', 0) < required_current:
-                continue
-
-            # Cell count check
-            cells_min = esc.get('CELLS_MIN', 0)
-            cells_max = esc.get('CELLS_MAX', 0)
-            if not (cells_min <= battery_cells <= cells_max):
-                continue
-
-            # Weight check
-            if weight_limit is not None:
-                if esc.get('WEIGHT', 0) > weight_limit:
-                    continue
-
-            # BEC check
-            has_bec = esc.get('BEC_VOLTAGE', 0) > 0
-            if require_bec and not has_bec:
-                # OPTO ESC requires separate UBEC
-                # Add weight penalty for UBEC (~20g)
-                if weight_limit is not None:
-                    if esc.get('WEIGHT', 0) + 0.020 > weight_limit:
-                        continue
+        # Current and cell count checks
+        mask = self.compatible_cell_mask(battery_cells)
+        mask &= self._current >= required_current
+
+        # Weight check
+        if weight_limit is not None:
+            mask &= self._weight <= weight_limit
 
-            compatible.append(esc_id)
+            # OPTO ESC requires separate UBEC: add ~20g weight penalty
+            if require_bec:
+                mask &= (self._bec_v > 0) | (self._weight + 0.020 <= weight_limit)
 
-        return compatible
+        return mask
 
     def select_optimal_esc(self,
                           motor_current: float,
@@ -154,35 +174,22 @@ class ESCDatabase:
         Returns:
             Best ESC ID or None if no compatible ESC
         """
-        compatible = self.get_compatible_escs(motor_current, battery_cells,
-                                               weight_limit, require_bec)
-
-        if not compatible:
+        # Single pass: compatibility and scoring share the field arrays
+        mask = self._compatibility_mask(motor_current, battery_cells,
+                                        weight_limit, require_bec)
+        if not mask.any():
             return None
 
         # Score: prioritize efficiency, penalize weight and cost
-        best_esc = None
-        best_score = float('-inf')
-
-        for esc_id in compatible:
-            esc = self.esc_db[esc_id]
-            eff = esc.get('EFFICIENCY', 0.90)
-            weight = esc.get('WEIGHT', 0.100) * 1000  # kg to g
-            cost = esc.get('COST', 100)
-
-            # Check if UBEC needed
-            has_bec = esc.get('BEC_VOLTAGE', 0) > 0
-            if require_bec and not has_bec:
-                weight += 20  # UBEC weight penalty
-                cost += 25    # UBEC cost penalty
+        # OPTO ESCs needing a separate UBEC get a 20g / $25 penalty
+        ubec = np.where((self._bec_v <= 0) & require_bec, 1.0, 0.0)
+        weight = self._weight * 1000 + ubec * 20  # kg to g
+        cost = self._cost + ubec * 25
 
-            score = eff * 2 - weight / 100 - cost / 1000
+        scores = np.where(mask, self._eff * 2 - weight / 100 - cost / 1000,
+                          -np.inf)
 
-            if score > best_score:
-                best_score = score
-                best_esc = esc_id
-
-        return best_esc
+        return self._ids[int(np.argmax(scores))]
 
     def get_esc(self, esc_id: str) -> Optional[Dict]:
         """Get ESC data by ID"""
@@ -288,24 +295,30 @@ class ESCDatabase:
         return True, f"BEC OK: {bec_voltage}V/{bec_current}A"
 
     def get_statistics(self) -> Dict:
-        """Get database statistics"""
+        """
+        Get database statistics
+
+        Returns:
+            Dict of raw numeric fields (currents in A, weights in kg,
+            efficiency as a 0-1 fraction, costs in USD); formatting is
+            left to the caller
+        """
         if not self.esc_db:
             return {}
 
-        currents = [e.get('CONT_CURRENT', 0) for e in self.esc_db.values()]
-        weights = [e.get('WEIGHT', 0) for e in self.esc_db.values()]
-        effs = [e.get('EFFICIENCY', 0) for e in self.esc_db.values()]
-        costs = [e.get('COST', 0) for e in self.esc_db.values()]
-        becs = [e for e in self.esc_db.values() if e.get('BEC_VOLTAGE', 0) > 0]
+        with_bec = int((self._bec_v > 0).sum())
 
         return {
             'total_escs': len(self.esc_db),
-            'current_range': f"{min(currents)}-{max(currents)} A",
-            'weight_range': f"{min(weights)*1000:.0f}-{max(weights)*1000:.0f} g",
-            'avg_efficiency': f"{sum(effs)/len(effs)*100:.1f}%",
-            'cost_range': f"${min(costs):.0f}-${max(costs):.0f}",
-            'with_bec': len(becs),
-            'opto_only': len(self.esc_db) - len(becs),
+            'current_min': float(self._current.min()),
+            'current_max': float(self._current.max()),
+            'weight_min': float(self._weight.min()),
+            'weight_max': float(self._weight.max()),
+            'avg_efficiency': float(self._eff.mean()),
+            'cost_min': float(self._cost.min()),
+            'cost_max': float(self._cost.max()),
+            'with_bec': with_bec,
+            'opto_only': len(self.esc_db) - with_bec,
             'by_size_class': {
                 size: len(escs) for size, escs in self.by_size.items()
             }
@@ -357,10 +370,10 @@ if __name__ == "__main__":
     stats = db.get_statistics()
     print(f"\nDatabase Statistics:")
     print(f"  Total ESCs: {stats['total_escs']}")
-    print(f"  Current range: {stats['current_range']}")
-    print(f"  Weight range: {stats['weight_range']}")
-    print(f"  Avg efficiency: {stats['avg_efficiency']}")
-    print(f"  Cost range: {stats['cost_range']}")
+    print(f"  Current range: {stats['current_min']}-{stats['current_max']} A")
+    print(f"  Weight range: {stats['weight_min']*1000:.0f}-{stats['weight_max']*1000:.0f} g")
+    print(f"  Avg efficiency: {stats['avg_efficiency']*100:.1f}%")
+    print(f"  Cost range: ${stats['cost_min']:.0f}-${stats['cost_max']:.0f}")
     print(f"  With BEC: {stats['with_bec']}")
     print(f"  OPTO only: {stats['opto_only']}")
     print(f"  Size classes: {stats['by_size_class']}")
@@ -0,0 +1,122 @@
+"""
+Cached JSON loading for the HFRPP component databases
+
+With orjson installed, files are parsed directly (orjson is as fast as
+unpickling, so nothing is cached). Without it, parsed files are cached as
+pickles in a per-user cache directory, because stdlib json is several
+times slower. A cache entry is used only while the (mtime_ns, size)
+signature stored in it matches the JSON file; the JSON stays
+authoritative. Cache files not owned by the current user, or writable by
+others, are ignored.
+
+Cache directory: $UAV_DB_CACHE_DIR, else $XDG_CACHE_HOME/uav_db, else
+~/.cache/uav_db. Setting UAV_DB_CACHE_DIR to an empty string disables
+the cache.
+
+Author: HFRPP Team
+Date: 2026-02-24
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from pathlib import Path
+
+# Try orjson (faster JSON parsing)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def load_json(path):
+    """
+    Load a JSON file (orjson, else stdlib json through the pickle cache)
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Parsed JSON data (a fresh object on every call)
+
+    Raises:
+        FileNotFoundError: If the JSON file does not exist
+    """
+    path = Path(path)
+    if ORJSON_AVAILABLE:
+        return orjson.loads(path.read_bytes())
+
+    # Stat before parsing: if the file changes meanwhile, the stored
+    # signature is stale and the next load parses again
+    st = path.stat()
+    signature = (st.st_mtime_ns, st.st_size)
+    cache_path = _cache_path(path)
+
+    if cache_path is not None:
+        try:
+            with open(cache_path, 'rb') as f:
+                if _is_private(f) and pickle.load(f) == signature:
+                    return pickle.load(f)
+        except Exception:
+            pass  # Missing, stale or unreadable cache: parse the JSON
+
+    with open(path, 'r') as f:
+        data = json.load(f)
+
+    if cache_path is not None:
+        _write_cache(cache_path, signature, data)
+    return data
+
+
+def _is_private(f):
+    """True if the open cache file is owned and writable only by this user"""
+    if not hasattr(os, 'getuid'):
+        return True  # No POSIX ownership (Windows)
+    st = os.fstat(f.fileno())
+    return st.st_uid == os.getuid() and not st.st_mode & 0o022
+
+
+def _cache_dir():
+    """Cache directory, or None when caching is disabled"""
+    override = os.environ.get('UAV_DB_CACHE_DIR')
+    if override is not None:
+        return Path(override) if override else None
+    base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / 'uav_db'
+
+
+def _cache_path(path):
+    """Cache file for a JSON path (name + hash of the absolute path)"""
+    cache_dir = _cache_dir()
+    if cache_dir is None:
+        return None
+    digest = hashlib.sha1(str(path.resolve()).encode('utf-8')).hexdigest()
+    return cache_dir / f"{path.stem}-{digest[:16]}.pkl"
+
+
+def _write_cache(cache_path, signature, data):
+    """
+    Write signature + data to a temp file and atomically move it into place,
+    so concurrent readers never see a partially written cache
+    """
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent,
+                                        prefix=cache_path.name,
+                                        suffix='.tmp')
+    except OSError:
+        return  # Cache location not writable, skip the cache
+
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(signature, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
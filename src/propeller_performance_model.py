@@ -6,14 +6,138 @@ Author: HFRPP Team
 Date: 2026-02-24
 """
 
+import functools
 import numpy as np
-import json
+import threading
 from pathlib import Path
+from types import MappingProxyType
+
+try:
+    from .json_cache import load_json
+except ImportError:  # Imported as a top-level module (src/ on sys.path)
+    from json_cache import load_json
+
+# Try Numba (JIT-compiled scalar polynomial kernel)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 # UIUC database path
 UIUC_DB_PATH = Path(__file__).parent / "propeller_ct_cp_lookup.json"
 
 
+def _frozen_array(values):
+    """Read-only float64 copy of a coefficient sequence"""
+    arr = np.array(values, dtype=np.float64)
+    arr.setflags(write=False)
+    return arr
+
+
+def _is_scalar(x):
+    """np.ndim(x) == 0, short-circuiting Python numbers (np.ndim costs ~1 µs)"""
+    return isinstance(x, (int, float)) or np.ndim(x) == 0
+
+
+def _as_operand(x):
+    """Scalars unchanged (plain float arithmetic), anything else as an array"""
+    return x if _is_scalar(x) else np.asarray(x)
+
+
+class _Prop:
+    """UIUC propeller record with fields unpacked once at load time"""
+
+    __slots__ = ('d_mm', 'p_mm', 'ct_coeffs', 'cp_coeffs', 'ct_arr', 'cp_arr',
+                 'j_range', 'ct_r2', 'cp_r2', 'pd_ratio')
+
+    def __init__(self, entry):
+        self.d_mm = entry.get('d_mm', 0)
+        self.p_mm = entry.get('p_mm', 0)
+        self.ct_coeffs = entry.get('ct_coeffs', [])
+        self.cp_coeffs = entry.get('cp_coeffs', [])
+        # Coefficients as read-only float64 arrays, converted once
+        self.ct_arr = _frozen_array(self.ct_coeffs)
+        self.cp_arr = _frozen_array(self.cp_coeffs)
+        self.j_range = entry.get('j_range', [0.1, 0.8])
+        self.ct_r2 = entry.get('ct_r2')
+        self.cp_r2 = entry.get('cp_r2')
+        self.pd_ratio = self.p_mm / self.d_mm if self.d_mm > 0 else 0.0
+
+
+def _horner(coeffs, x):
+    """
+    Evaluate a polynomial (highest power first) by Horner's rule.
+
+    Same arithmetic as np.polyval without its per-call array conversion.
+    Cubic to quintic fits (the usual UIUC degrees) are unrolled.
+    """
+    n = len(coeffs)
+    if n == 5:
+        c0, c1, c2, c3, c4 = coeffs
+        return (((c0 * x + c1) * x + c2) * x + c3) * x + c4
+    if n == 4:
+        c0, c1, c2, c3 = coeffs
+        return ((c0 * x + c1) * x + c2) * x + c3
+    if n == 6:
+        c0, c1, c2, c3, c4, c5 = coeffs
+        return ((((c0 * x + c1) * x + c2) * x + c3) * x + c4) * x + c5
+    result = 0.0
+    for c in coeffs:
+        result = result * x + c
+    return result
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _horner_jit(coeffs, x):
+        """Compiled scalar Horner evaluation over a float64 array"""
+        result = 0.0
+        for i in range(coeffs.shape[0]):
+            result = result * x + coeffs[i]
+        return result
+
+
+def _polyval(coeffs, x):
+    """Polynomial value at x, using the JIT kernel for scalar x"""
+    if NUMBA_AVAILABLE and _is_scalar(x) and isinstance(coeffs, np.ndarray):
+        return _horner_jit(coeffs, float(x))
+    return _horner(coeffs, x)
+
+
+def _horner2(coeffs_a, coeffs_b, x):
+    """Evaluate two polynomials of equal length at x in one Horner pass"""
+    result_a = 0.0
+    result_b = 0.0
+    for a, b in zip(coeffs_a, coeffs_b):
+        result_a = result_a * x + a
+        result_b = result_b * x + b
+    return result_a, result_b
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _horner2_jit(coeffs_a, coeffs_b, x):
+        """Compiled fused Horner evaluation of two equal-length arrays"""
+        result_a = 0.0
+        result_b = 0.0
+        for i in range(coeffs_a.shape[0]):
+            result_a = result_a * x + coeffs_a[i]
+            result_b = result_b * x + coeffs_b[i]
+        return result_a, result_b
+
+
+def _polyval2(coeffs_a, coeffs_b, x):
+    """Values of two polynomials at x; fused when their lengths match"""
+    if len(coeffs_a) != len(coeffs_b):
+        return _polyval(coeffs_a, x), _polyval(coeffs_b, x)
+    if (NUMBA_AVAILABLE and _is_scalar(x)
+            and isinstance(coeffs_a, np.ndarray)
+            and isinstance(coeffs_b, np.ndarray)):
+        return _horner2_jit(coeffs_a, coeffs_b, float(x))
+    return _horner2(coeffs_a, coeffs_b, x)
+
+
 class PropellerPerformanceModel:
     """
     Hybrid propeller performance model with 3-tier strategy:
@@ -27,13 +151,33 @@ class PropellerPerformanceModel:
     ACCURACY_MEDIUM = 'medium'  # UIUC scaled
     ACCURACY_LOW = 'low'        # Simple model
 
+    # Target element count of the per-block temporaries in
+    # _find_closest_batch (~8 MB per float64 array)
+    _BATCH_BLOCK = 1 << 20
+
+    # Minimum database size for the kd-tree index; below it the sorted
+    # diameter slice is faster (SciPy is then not imported at all)
+    _KDTREE_MIN_SIZE = 5000
+
+    # Result method -> usage counter
+    _METHOD_STATS = {
+        'uiuc_exact': 'exact_match',
+        'uiuc_scaled': 'scaled_match',
+        'simple': 'simple_fallback'
+    }
+
     def __init__(self, uiuc_db_path=None):
         """Load UIUC propeller database"""
-        self.uiuc_db = self._load_uiuc_db(uiuc_db_path or UIUC_DB_PATH)
+        raw_db = self._load_uiuc_db(uiuc_db_path or UIUC_DB_PATH)
+        self.uiuc_db = {key: _Prop(entry) for key, entry in raw_db.items()}
 
         # Build index for faster lookup
         self._build_index()
 
+        # Per-instance memo of lookups keyed by rounded (d, p)
+        self._get_performance_cached = functools.lru_cache(maxsize=4096)(
+            self._compute_performance)
+
         # Statistics
         self.stats = {
             'exact_match': 0,
@@ -43,34 +187,52 @@ class PropellerPerformanceModel:
         }
 
     def _load_uiuc_db(self, path):
-        """Load UIUC CT/CP database"""
+        """Load UIUC CT/CP database as raw JSON entries (parse cached)"""
         try:
-            with open(path, 'r') as f:
-                return json.load(f)
+            return load_json(path)
         except FileNotFoundError:
             print(f"Warning: UIUC DB not found at {path}")
             return {}
 
     def _build_index(self):
-        """Build lookup index by diameter and pitch"""
-        self.by_diameter = {}
-        self.by_ratio = {}
-
+        """Build structure-of-arrays lookup index (diameter, pitch, P/D)"""
+        # One pass over the records; each row is (d_mm, p_mm, P/D)
+        props = list(self.uiuc_db.values())
+        n = len(props)
+        self._props = np.empty(n, dtype=object)
+        self._props[:] = props
+        self._d_arr, self._p_arr, self._pd_arr = np.array(
+            [(prop.d_mm, prop.p_mm, prop.pd_ratio) for prop in props],
+            dtype=np.float64).reshape(n, 3).T.copy()
+
+        # Exact-match index keyed by the integer (d, p) pair of each
+        # "DxP" database key (keys are rounded, so not int(d_mm))
+        self._exact_by_dp = {}
         for key, prop in self.uiuc_db.items():
-            d = prop.get('d_mm', 0)
-            p = prop.get('p_mm', 0)
-            ratio = p / d if d > 0 else 0
-
-            # Index by diameter (range ±10%)
-            if d not in self.by_diameter:
-                self.by_diameter[d] = []
-            self.by_diameter[d].append(prop)
-
-            # Index by pitch/diameter ratio
-            ratio_key = round(ratio, 2)
-            if ratio_key not in self.by_ratio:
-                self.by_ratio[ratio_key] = []
-            self.by_ratio[ratio_key].append(prop)
+            d_key, sep, p_key = key.partition('x')
+            if sep and d_key.isdigit() and p_key.isdigit():
+                self._exact_by_dp[(int(d_key), int(p_key))] = (key, prop)
+
+        # Diameter-sorted order for range queries without a kd-tree
+        self._d_sort_idx = np.argsort(self._d_arr, kind='stable')
+        self._d_sorted = self._d_arr[self._d_sort_idx]
+
+        # kd-tree over (D, P/D) for large databases only
+        self._kdt = None
+        self._pd_scale = 1.0
+        has_d = self._d_arr > 0
+        if n >= self._KDTREE_MIN_SIZE and has_d.any():
+            try:
+                from scipy.spatial import cKDTree
+            except ImportError:
+                return  # Sorted diameter slice only
+            # P/D scaled to diameter units, times 0.3 / 0.05 so the query
+            # box spans about ±30% D and ±5% P/D (the match tolerances)
+            mean_pd = self._pd_arr[has_d].mean()
+            if mean_pd > 0:
+                self._pd_scale = 6.0 * self._d_arr[has_d].mean() / mean_pd
+            self._kdt = cKDTree(np.column_stack(
+                [self._d_arr, self._pd_arr * self._pd_scale]))
 
     def get_performance(self, diameter_mm, pitch_mm, brand=None):
         """
@@ -79,57 +241,133 @@ class PropellerPerformanceModel:
         Args:
             diameter_mm: Propeller diameter in mm
             pitch_mm: Propeller pitch in mm
-            brand: Manufacturer (optional, for exact match)
+            brand: Ignored; kept for API compatibility (the UIUC database
+                holds one record per diameter x pitch, so there is nothing
+                to choose between)
 
         Returns:
-            dict with ct_coeffs, cp_coeffs, accuracy, method
+            Read-only mapping with ct_coeffs, cp_coeffs, accuracy, method
+            (results are memoized and shared between calls)
         """
-        self.stats['total'] += 1
-
         # Round to nearest mm for matching
-        d = round(diameter_mm)
-        p = round(pitch_mm)
-        key = f"{d}x{p}"
+        d = int(round(diameter_mm))
+        p = int(round(pitch_mm))
+        perf = self._get_performance_cached(d, p)
+
+        # Statistics stay outside the cache so every query is counted
+        self.stats['total'] += 1
+        self.stats[self._METHOD_STATS[perf['method']]] += 1
+        return perf
 
+    def _compute_performance(self, d, p):
+        """Uncached lookup for rounded diameter/pitch (mm)"""
         # Level 1: Exact match
-        if key in self.uiuc_db:
-            self.stats['exact_match'] += 1
-            prop = self.uiuc_db[key]
-            return {
+        exact = self._exact_by_dp.get((d, p))
+        if exact is not None:
+            key, prop = exact
+            return MappingProxyType({
                 'method': 'uiuc_exact',
-                'ct_coeffs': prop.get('ct_coeffs'),
-                'cp_coeffs': prop.get('cp_coeffs'),
-                'j_range': prop.get('j_range', [0.1, 0.8]),
+                'ct_coeffs': prop.ct_arr,
+                'cp_coeffs': prop.cp_arr,
+                'j_range': prop.j_range,
                 'accuracy': self.ACCURACY_HIGH,
-                'r2_ct': prop.get('ct_r2'),
-                'r2_cp': prop.get('cp_r2'),
+                'r2_ct': prop.ct_r2,
+                'r2_cp': prop.cp_r2,
                 'source_prop': key
-            }
+            })
 
         # Level 2: Scaled from closest UIUC
         closest = self._find_closest(d, p)
         if closest:
-            pd_error = abs(closest['p_mm'] / closest['d_mm'] - p / d)
+            pd_error = abs(closest.pd_ratio - p / d)
             if pd_error < 0.15:  # 15% tolerance
-                self.stats['scaled_match'] += 1
                 scaled = self._scale_performance(closest, d, p)
-                return {
+                return MappingProxyType({
                     'method': 'uiuc_scaled',
                     'ct_coeffs': scaled['ct_coeffs'],
                     'cp_coeffs': scaled['cp_coeffs'],
-                    'j_range': closest.get('j_range', [0.1, 0.8]),
+                    'j_range': closest.j_range,
                     'accuracy': self.ACCURACY_MEDIUM,
-                    'source_prop': f"{closest['d_mm']}x{closest['p_mm']}",
+                    'source_prop': f"{closest.d_mm}x{closest.p_mm}",
                     'pd_error': pd_error
-                }
+                })
+
+        # Level 3: Simple model fallback (shared, read-only)
+        return _SIMPLE_RESULT
+
+    def get_performance_batch(self, diameter_mm, pitch_mm):
+        """
+        Get propeller performance coefficients for many propellers at once
+
+        Exact matches are resolved by index lookup and the closest-match
+        search for the rest runs as one vectorized pass over the batch.
+
+        Args:
+            diameter_mm: Propeller diameters in mm (array-like)
+            pitch_mm: Propeller pitches in mm (array-like, same shape)
+
+        Returns:
+            Dict of parallel object arrays: method, accuracy, ct_coeffs,
+            cp_coeffs, source_prop (coefficients are None for 'simple')
+        """
+        # Round to nearest mm for matching (half to even, like round())
+        d = np.rint(np.ravel(diameter_mm).astype(np.float64)).astype(int)
+        p = np.rint(np.ravel(pitch_mm).astype(np.float64)).astype(int)
+        d_list = d.tolist()
+        p_list = p.tolist()
+        n = d.size
+
+        method = np.full(n, 'simple', dtype=object)
+        accuracy = np.full(n, self.ACCURACY_LOW, dtype=object)
+        ct_coeffs = np.full(n, None, dtype=object)
+        cp_coeffs = np.full(n, None, dtype=object)
+        source_prop = np.full(n, None, dtype=object)
+
+        # Level 1: Exact match
+        exact = self._exact_by_dp
+        missing = []
+        for i, dp in enumerate(zip(d_list, p_list)):
+            hit = exact.get(dp)
+            if hit is None:
+                missing.append(i)
+                continue
+            key, prop = hit
+            method[i] = 'uiuc_exact'
+            accuracy[i] = self.ACCURACY_HIGH
+            ct_coeffs[i] = prop.ct_arr
+            cp_coeffs[i] = prop.cp_arr
+            source_prop[i] = key
+
+        # Level 2: Scaled from closest UIUC (vectorized search)
+        if missing:
+            missing = np.asarray(missing)
+            closest = self._find_closest_batch(d[missing], p[missing])
+            for i, j in zip(missing.tolist(), closest.tolist()):
+                if j < 0:
+                    continue
+                prop = self._props[j]
+                d_i, p_i = d_list[i], p_list[i]
+                pd_error = abs(prop.pd_ratio - p_i / d_i)
+                if pd_error < 0.15:  # 15% tolerance
+                    scaled = self._scale_performance(prop, d_i, p_i)
+                    method[i] = 'uiuc_scaled'
+                    accuracy[i] = self.ACCURACY_MEDIUM
+                    ct_coeffs[i] = scaled['ct_coeffs']
+                    cp_coeffs[i] = scaled['cp_coeffs']
+                    source_prop[i] = f"{prop.d_mm}x{prop.p_mm}"
+
+        # Statistics
+        self.stats['total'] += n
+        names, counts = np.unique(method.astype(str), return_counts=True)
+        for name, count in zip(names.tolist(), counts.tolist()):
+            self.stats[self._METHOD_STATS[name]] += count
 
-        # Level 3: Simple model fallback
-        self.stats['simple_fallback'] += 1
         return {
-            'method': 'simple',
-            'eta_total': 0.50,  # Conservative efficiency
-            'accuracy': self.ACCURACY_LOW,
-            'note': 'Using simplified efficiency model'
+            'method': method,
+            'accuracy': accuracy,
+            'ct_coeffs': ct_coeffs,
+            'cp_coeffs': cp_coeffs,
+            'source_prop': source_prop
         }
 
     def _find_closest(self, d, p):
@@ -140,38 +378,99 @@ class PropellerPerformanceModel:
         Validation shows scaling errors exceed 40% when P/D differs by >5%.
         See: propeller_scaling_validation_report.md
         """
-        target_pd = p / d if d > 0 else 0
-        best = None
-        min_score = float('inf')
-
         # STRICT TOLERANCE: P/D ratio must be within ±5%
         # Based on validation: scaling works ±5% P/D, fails beyond
         PD_TOLERANCE = 0.05
 
-        for prop in self.uiuc_db.values():
-            prop_d = prop.get('d_mm', 0)
-            prop_p = prop.get('p_mm', 0)
-            if prop_d == 0:
-                continue
+        if d <= 0 or p / d <= 0 or not self._props.size:
+            return None
+        target_pd = p / d
 
-            prop_pd = prop_p / prop_d
+        cand = self._candidates(d, target_pd, PD_TOLERANCE, 0.3)
+        if not cand.size:
+            return None
+        d_cand = self._d_arr[cand]
 
-            # P/D difference (normalized)
-            pd_diff = abs(prop_pd - target_pd) / target_pd if target_pd > 0 else 1
+        # P/D difference (normalized); skip props without a diameter
+        pd_diff = np.abs(self._pd_arr[cand] - target_pd) / target_pd
+        valid = (d_cand > 0) & (pd_diff <= PD_TOLERANCE)
 
-            # STRICT: Skip if P/D ratio differs by more than 5%
-            if pd_diff > PD_TOLERANCE:
-                continue
+        # Size difference (only criterion after P/D filter)
+        size_diff = np.where(valid, np.abs(d_cand - d) / d, np.inf)
+        idx = int(np.argmin(size_diff))
 
-            # Size difference (only criterion after P/D filter)
-            size_diff = abs(prop_d - d) / d
+        # Also require diameter within ±30% for physical similarity
+        return self._props[cand[idx]] if size_diff[idx] < 0.3 else None
 
-            if size_diff < min_score:
-                min_score = size_diff
-                best = prop
+    def _find_closest_batch(self, d, p):
+        """
+        Vectorized _find_closest over arrays of diameters and pitches.
 
-        # Also require diameter within ±30% for physical similarity
-        return best if min_score < 0.3 else None
+        Returns the index into self._props of the closest propeller for
+        each query, or -1 where none is within tolerance.
+        """
+        PD_TOLERANCE = 0.05
+
+        d = np.asarray(d, dtype=np.float64)
+        p = np.asarray(p, dtype=np.float64)
+        result = np.full(d.shape, -1, dtype=np.intp)
+        if not self._props.size:
+            return result
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            target_pd = np.where(d > 0, p / d, 0.0)
+        ok = (d > 0) & (target_pd > 0)
+        if not ok.any():
+            return result
+        d_q = d[ok]
+        pd_q = target_pd[ok]
+        closest = np.empty(d_q.size, dtype=np.intp)
+
+        # Rows: database propellers, columns: queries. Queries go in column
+        # blocks so each (N_db x block) temporary stays near _BATCH_BLOCK
+        # elements however large the batch is
+        d_db = self._d_arr[:, None]
+        pd_db = self._pd_arr[:, None]
+        no_d = d_db <= 0
+        block = max(1, self._BATCH_BLOCK // self._props.size)
+        for start in range(0, d_q.size, block):
+            d_blk = d_q[start:start + block]
+            pd_blk = pd_q[start:start + block]
+
+            pd_diff = np.abs(pd_db - pd_blk)
+            pd_diff /= pd_blk
+            size_diff = np.abs(d_db - d_blk)
+            size_diff /= d_blk
+            size_diff[no_d | (pd_diff > PD_TOLERANCE)] = np.inf
+            idx = np.argmin(size_diff, axis=0)
+
+            # Also require diameter within ±30% for physical similarity
+            best = size_diff[idx, np.arange(idx.size)]
+            closest[start:start + block] = np.where(best < 0.3, idx, -1)
+
+        result[ok] = closest
+        return result
+
+    def _candidates(self, d, target_pd, pd_tol, d_tol):
+        """
+        Indices (ascending) of propellers that may lie within the P/D and
+        diameter tolerances; a superset that callers filter exactly.
+
+        With a kd-tree (large databases, SciPy installed) a box query
+        (Chebyshev ball) prunes by both tolerances; otherwise the diameter
+        band is sliced from the sorted diameters with a binary search.
+        """
+        # Small relative margin so float rounding never drops a boundary hit
+        margin = 1 + 1e-9
+        if self._kdt is None:
+            lo, hi = np.searchsorted(
+                self._d_sorted,
+                [d - d_tol * d * margin, d + d_tol * d * margin])
+            return np.sort(self._d_sort_idx[lo:hi])
+        scale = self._pd_scale
+        r = max(d_tol * d, pd_tol * target_pd * scale) * margin
+        cand = self._kdt.query_ball_point([d, target_pd * scale], r, p=np.inf)
+        return np.sort(np.asarray(cand, dtype=np.intp))
 
     def _scale_performance(self, base_prop, target_d, target_p):
         """
@@ -189,29 +488,36 @@ class PropellerPerformanceModel:
 
         This captures the non-linear dependence of CT on Reynolds number.
         """
-        base_d = base_prop.get('d_mm', 1)
-        base_p = base_prop.get('p_mm', 1)
+        base_d = base_prop.d_mm
+        base_p = base_prop.p_mm
 
-        # Estimate Reynolds numbers
+        # Estimate Reynolds numbers (inlined _estimate_reynolds)
         # Re = rho * omega * r^2 / mu ≈ rpm * D * (P/D) / const
         # We use relative Re, so constants cancel
-        Re_base = self._estimate_reynolds(base_d, base_p)
-        Re_target = self._estimate_reynolds(target_d, target_p)
+        Re_base = base_p * base_d
+        Re_target = target_p * target_d
 
         # NON-LINEAR: Re-dependent exponent
-        n_ct = self._reynolds_exponent_ct(Re_base, Re_target)
-        n_cp = self._reynolds_exponent_cp(Re_base, Re_target)
+        # (inlined _reynolds_exponent_ct / _reynolds_exponent_cp)
+        Re_avg = (Re_base + Re_target) / 2
+        if Re_avg < 50000:
+            n_ct = 0.15
+            n_cp = 0.08
+        elif Re_avg < 100000:
+            fraction = (Re_avg - 50000) / 50000
+            n_ct = 0.15 - 0.07 * fraction
+            n_cp = 0.08 - 0.04 * fraction
+        else:
+            n_ct = 0.08
+            n_cp = 0.04
 
         # Scale coefficients with Re-dependent exponent
         re_ratio = Re_target / Re_base
         ct_scale = re_ratio ** (-n_ct)
         cp_scale = re_ratio ** (-n_cp)
 
-        ct_coeffs = base_prop.get('ct_coeffs', [])
-        cp_coeffs = base_prop.get('cp_coeffs', [])
-
-        scaled_ct = [c * ct_scale for c in ct_coeffs]
-        scaled_cp = [c * cp_scale for c in cp_coeffs]
+        scaled_ct = _frozen_array(base_prop.ct_arr * ct_scale)
+        scaled_cp = _frozen_array(base_prop.cp_arr * cp_scale)
 
         return {
             'ct_coeffs': scaled_ct,
@@ -283,21 +589,21 @@ class PropellerPerformanceModel:
 
         Args:
             perf: Performance dict from get_performance()
-            J: Advance ratio
-            rpm: Propeller RPM
+            J: Advance ratio (scalar or array)
+            rpm: Propeller RPM (scalar or array, broadcast with J)
             diameter_m: Diameter in meters
             rho: Air density (kg/m³)
 
         Returns:
-            Thrust in Newtons
+            Thrust in Newtons (array for array inputs)
         """
         if perf['method'] == 'simple':
             # Simple model: T = eta * P / V
             # Need power input - return placeholder
             return None
 
-        n = rpm / 60.0  # rps
-        CT = np.polyval(perf['ct_coeffs'], J)
+        n = _as_operand(rpm) / 60.0  # rps
+        CT = _polyval(perf['ct_coeffs'], _as_operand(J))
         T = CT * rho * n**2 * diameter_m**4
         return T
 
@@ -307,30 +613,41 @@ class PropellerPerformanceModel:
 
         Args:
             perf: Performance dict from get_performance()
-            J: Advance ratio
-            rpm: Propeller RPM
+            J: Advance ratio (scalar or array)
+            rpm: Propeller RPM (scalar or array, broadcast with J)
             diameter_m: Diameter in meters
             rho: Air density (kg/m³)
 
         Returns:
-            Power in Watts
+            Power in Watts (array for array inputs)
         """
         if perf['method'] == 'simple':
             return None
 
-        n = rpm / 60.0  # rps
-        CP = np.polyval(perf['cp_coeffs'], J)
+        n = _as_operand(rpm) / 60.0  # rps
+        CP = _polyval(perf['cp_coeffs'], _as_operand(J))
         P = CP * rho * n**3 * diameter_m**5
         return P
 
     def compute_efficiency(self, perf, J):
-        """Compute propeller efficiency eta = J * CT / CP"""
+        """
+        Compute propeller efficiency eta = J * CT / CP
+
+        J may be a scalar or an array; eta is 0 wherever CP <= 0.
+        """
+        J = _as_operand(J)
+        scalar = _is_scalar(J)
         if perf['method'] == 'simple':
-            return perf.get('eta_total', 0.50)
+            eta_total = perf.get('eta_total', 0.50)
+            return eta_total if scalar else np.full(J.shape, eta_total)
 
-        CT = np.polyval(perf['ct_coeffs'], J)
-        CP = np.polyval(perf['cp_coeffs'], J)
-        return J * CT / CP if CP > 0 else 0
+        CT, CP = _polyval2(perf['ct_coeffs'], perf['cp_coeffs'], J)
+        if scalar:
+            # Scalar fast path, no masked division needed
+            return J * CT / CP if CP > 0 else 0.0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            eta = np.where(CP > 0, J * CT / CP, 0.0)
+        return eta
 
     def get_statistics(self):
         """Get usage statistics"""
@@ -343,7 +660,8 @@ class PropellerPerformanceModel:
         }
 
     def reset_statistics(self):
-        """Reset usage counters"""
+        """Reset usage counters (and the performance lookup cache)"""
+        self._get_performance_cached.cache_clear()
         self.stats = {
             'exact_match': 0,
             'scaled_match': 0,
@@ -352,15 +670,32 @@ class PropellerPerformanceModel:
         }
 
 
-# Singleton instance
+# Simple model fallback result, shared by every level-3 query
+_SIMPLE_RESULT = MappingProxyType({
+    'method': 'simple',
+    'eta_total': 0.50,  # Conservative efficiency
+    'accuracy': PropellerPerformanceModel.ACCURACY_LOW,
+    'note': 'Using simplified efficiency model'
+})
+
+
+# Singleton instance, created once under _model_lock
 _model_instance = None
+_model_lock = threading.Lock()
 
 
 def get_propeller_model():
     """Get global propeller performance model instance"""
     global _model_instance
     if _model_instance is None:
-        _model_instance = PropellerPerformanceModel()
+        with _model_lock:
+            if _model_instance is None:
+                model = PropellerPerformanceModel()
+                if NUMBA_AVAILABLE:
+                    # Pre-warm the JIT kernels so the first query is fast
+                    _horner_jit(np.zeros(1), 0.0)
+                    _horner2_jit(np.zeros(1), np.zeros(1), 0.0)
+                _model_instance = model
     return _model_instance
 
 
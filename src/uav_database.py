@@ -69,10 +69,14 @@ Veritabani yapisi:
 }
 """
 
-import json
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
+try:
+    from .json_cache import load_json
+except ImportError:  # Doğrudan modül olarak içe aktarıldığında (src/ yolda)
+    from json_cache import load_json
+
 
 class UAVDatabase:
     """
@@ -112,8 +116,7 @@ class UAVDatabase:
             # Varsayılan dosya yolu
             db_path = Path(__file__).parent.parent / "data" / "UAV_Database_v1.1.0_validated.json"
 
-        with open(db_path, 'r') as f:
-            self.data = json.load(f)
+        self.data = self._load_json(Path(db_path))
 
         self.batteries = self.data.get('Battery', {})
         self.motors = self.data.get('Motor', {})
@@ -121,6 +124,50 @@ class UAVDatabase:
         self.escs = self.data.get('ESC', {})
         self.wing = self.data.get('Wing', {})
 
+        # Küçük harfli alan adlarını bir kez standart (büyük harf) ada çevir
+        self._normalize_keys(self.propellers, ('weight', 'diameter', 'pitch'))
+        self._normalize_keys(self.motors, ('weight',))
+        self._normalize_keys(self.escs, ('weight',))
+
+        # Liste görünümleri ilk istekte bir kez oluşturulur
+        self.invalidate_cache()
+
+    @staticmethod
+    def _load_json(db_path: Path) -> Dict[str, Any]:
+        """
+        JSON veritabanını yükle
+
+        Ayrıştırma sonucu json_cache ile önbelleğe alınır (JSON esas
+        kaynaktır).
+        """
+        return load_json(db_path)
+
+    def invalidate_cache(self) -> None:
+        """
+        Önbelleğe alınmış bileşen listelerini temizle
+
+        Ham veri (ör. testlerde) değiştirildiğinde çağrılmalıdır; listeler
+        bir sonraki istekte yeniden oluşturulur.
+        """
+        self._battery_cache = None
+        self._motor_cache = None
+        self._esc_cache = None
+        self._propeller_cache = None
+        self._wing_cache = None
+
+    @staticmethod
+    def _normalize_keys(components: Dict[str, Dict], keys) -> None:
+        """
+        Küçük harfli alanları büyük harfli karşılığına taşı
+
+        Büyük harfli alan zaten varsa öncelik onundur; küçük harfli
+        alana dokunulmaz.
+        """
+        for s in components.values():
+            for k in keys:
+                if k in s and k.upper() not in s:
+                    s[k.upper()] = s.pop(k)
+
     def get_battery_list(self) -> List[Dict[str, Any]]:
         """
         Batarya listesini döndür
@@ -139,7 +186,16 @@ class UAVDatabase:
                 'energy_wh': float,
                 'power_w': float
             }, ...]
+
+        Liste ilk çağrıda bir kez oluşturulur ve paylaşılır;
+        değiştirilmemelidir (bkz. invalidate_cache).
         """
+        if self._battery_cache is None:
+            self._battery_cache = self._build_battery_list()
+        return self._battery_cache
+
+    def _build_battery_list(self) -> List[Dict[str, Any]]:
+        """Batarya listesini veritabanından oluştur"""
         return [{
             'name': n,
             'capacity_mah': s.get('CAPACITY', 0),
@@ -170,7 +226,16 @@ class UAVDatabase:
                 'cost_usd': float,
                 'verified': bool
             }, ...]
+
+        Liste ilk çağrıda bir kez oluşturulur ve paylaşılır;
+        değiştirilmemelidir (bkz. invalidate_cache).
         """
+        if self._motor_cache is None:
+            self._motor_cache = self._build_motor_list()
+        return self._motor_cache
+
+    def _build_motor_list(self) -> List[Dict[str, Any]]:
+        """Motor listesini veritabanından oluştur"""
         return [{
             'name': n,
             'kv': s.get('KV', 0),
@@ -203,7 +268,16 @@ class UAVDatabase:
                 'cost_usd': float,
                 'verified': bool
             }, ...]
+
+        Liste ilk çağrıda bir kez oluşturulur ve paylaşılır;
+        değiştirilmemelidir (bkz. invalidate_cache).
         """
+        if self._esc_cache is None:
+            self._esc_cache = self._build_esc_list()
+        return self._esc_cache
+
+    def _build_esc_list(self) -> List[Dict[str, Any]]:
+        """ESC listesini veritabanından oluştur"""
         return [{
             'name': n,
             'cont_current': s.get('CONT_CURRENT', s.get('PEAK_CURRENT', 0) / 1.2),
@@ -233,15 +307,28 @@ class UAVDatabase:
                 'cost_usd': float,
                 'thrust_n': float
             }, ...]
+
+        Liste ilk çağrıda bir kez oluşturulur ve paylaşılır;
+        değiştirilmemelidir (bkz. invalidate_cache).
         """
-        return [{
-            'name': n,
-            'diameter_mm': s.get('DIAMETER', s.get('diameter', 0)),
-            'pitch_mm': s.get('PITCH', s.get('pitch', 0)),
-            'weight_kg': s.get('WEIGHT', s.get('weight', 0)) / 1000 if s.get('WEIGHT', s.get('weight', 0)) > 1 else s.get('WEIGHT', s.get('weight', 0)),
-            'cost_usd': s.get('COST', 15),
-            'thrust_n': s.get('Thrust', 0)
-        } for n, s in self.propellers.items()]
+        if self._propeller_cache is None:
+            self._propeller_cache = self._build_propeller_list()
+        return self._propeller_cache
+
+    def _build_propeller_list(self) -> List[Dict[str, Any]]:
+        """Propeller listesini veritabanından oluştur"""
+        propellers = []
+        for n, s in self.propellers.items():
+            w = s.get('WEIGHT', 0)
+            propellers.append({
+                'name': n,
+                'diameter_mm': s.get('DIAMETER', 0),
+                'pitch_mm': s.get('PITCH', 0),
+                'weight_kg': w / 1000 if w > 1 else w,  # g -> kg (gerekirse)
+                'cost_usd': s.get('COST', 15),
+                'thrust_n': s.get('Thrust', 0)
+            })
+        return propellers
 
     def get_wing_list(self) -> List[Dict[str, Any]]:
         """
@@ -257,7 +344,16 @@ class UAVDatabase:
                 'k': float,
                 'CM': float
             }, ...]
+
+        Liste ilk çağrıda bir kez oluşturulur ve paylaşılır;
+        değiştirilmemelidir (bkz. invalidate_cache).
         """
+        if self._wing_cache is None:
+            self._wing_cache = self._build_wing_list()
+        return self._wing_cache
+
+    def _build_wing_list(self) -> List[Dict[str, Any]]:
+        """Kanat profili listesini veritabanından oluştur"""
         return [{
             'name': n,
             'CL_max': s.get('CL_max', 1.5),
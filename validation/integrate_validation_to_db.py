@@ -4,16 +4,38 @@ Validasyon verilerini UAV_Database'a entegre etmek için script
 ESC v3 ve Airfoil analiz sonuçlarını ana veritabanına birleştirir
 """
 
+import gzip
 import json
+import os
+import sys
+from collections import Counter
+from operator import methodcaller
 from pathlib import Path
 from datetime import datetime
 
+# orjson varsa kullan (daha hızlı JSON kodlama)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Sabitler (metadata ve sayımlarda ortak kullanılır)
+DB_VERSION = 'v1.1.0'
+CONFIDENCE_HIGH = 'high'
+CONFIDENCE_MEDIUM = 'medium'
+CONFIDENCE_LOW = 'low'
+
 # Dosya yolları
 db_path = Path('/Users/bekiragirgun/Downloads/UAV_Database_v1.1.0_validated.json')
 esc_v3_path = Path('/Users/bekiragirgun/Projects/001_Makale02_literatur_review/HFRPP/data/esc_database_v3.json')
 airfoil_analysis_path = Path('/Users/bekiragirgun/Projects/001_Makale02_literatur_review/HFRPP/data/airfoil_analysis_results.json')
 output_path = Path('/Users/bekiragirgun/Downloads/UAV_Database_v1.1.0_validated.json')
 
+# Çıktıyı gzip ile sıkıştır (<çıktı>.json.gz, seviye 1). UAVDatabase düz
+# JSON okuduğu için varsayılan olarak kapalı
+GZIP_OUTPUT = False
+
 # Mevcut veritabanını yükle
 print("Ana veritabanı yükleniyor...")
 with open(db_path, 'r') as f:
@@ -37,18 +59,32 @@ print("\n[1/3] ESC verileri güncelleniyor...")
 # Mevcut ESC'leri al
 current_escs = db.get('ESC', {})
 
-# Her ESC modeli için güncelle
+
+def normalize_name(name):
+    """İsim karşılaştırması için normalize et (küçük harf, '_' → ' ')"""
+    return name.lower().replace('_', ' ').strip()
+
+
+# ESC v3 isimlerini bir kez indeksle: normalize isim → v3 anahtarı
+# (aynı normalize isimde ilk anahtar geçerli, eski döngüdeki gibi)
+v3_keys = list(esc_v3['ESC_Database'])
+v3_by_norm = {}
+for v3_key in v3_keys:
+    v3_by_norm.setdefault(normalize_name(v3_key), v3_key)
+
+# Her ESC modeli için güncelle (ilerleme satırları toplanıp tek seferde yazılır)
+updated_lines = []
 for esc_name, esc_data in current_escs.items():
-    # ESC v3'de karşılık gelen modeli ara
-    v3_name = None
-    for v3_key in esc_v3['ESC_Database'].keys():
-        # Benzer isim kontrolü (var olan değişiklikleri eşleştir)
-        if esc_name.replace('_', ' ').replace(' ', '_') == v3_key or \
-           esc_name == v3_key or \
-           v3_key in esc_name or \
-           esc_name in v3_key:
-            v3_name = v3_key
-            break
+    # ESC v3'de karşılık gelen modeli ara: önce normalize isimle birebir,
+    # bulunamazsa alt dizi eşleşmesi (isimlerden biri diğerini içeriyorsa).
+    # Benzerlik (fuzzy) eşleşmesi yapılmaz: farklı akım/hücre değerli
+    # modelleri eşleştirip yanlış veri yazıyordu
+    v3_name = v3_by_norm.get(normalize_name(esc_name))
+    if v3_name is None:
+        for v3_key in v3_keys:
+            if v3_key in esc_name or esc_name in v3_key:
+                v3_name = v3_key
+                break
 
     # Eşleşme varsa verileri güncelle
     if v3_name:
@@ -87,7 +123,10 @@ for esc_name, esc_data in current_escs.items():
         if 'CELLS_MAX' in v3_data and v3_data['CELLS_MAX'] is not None:
             esc_data['VOLTAGE_MAX'] = v3_data['CELLS_MAX'] * 3.7
 
-        print(f"  ✓ {esc_name} güncellendi (VERIFIED={esc_data.get('VERIFIED', False)})")
+        updated_lines.append(f"  ✓ {esc_name} güncellendi (VERIFIED={esc_data.get('VERIFIED', False)})")
+
+if updated_lines:
+    sys.stdout.write("\n".join(updated_lines) + "\n")
 
 # Model değişikliklerini not et
 if 'model_replacements' not in db:
@@ -102,14 +141,15 @@ print("\n[2/3] Airfoil verileri güncelleniyor...")
 # Mevcut airfoil'ları al
 current_airfoils = db.get('Wing', {}).get('AIRFOILS', {})
 
-# Her airfoil için güncelle
+# Her airfoil için güncelle (ilerleme satırları toplanıp tek seferde yazılır)
+updated_lines = []
 for airfoil_name, airfoil_data in current_airfoils.items():
     # Analiz sonuçlarında karşılık ara
     if airfoil_name in airfoil_analysis:
         analysis_data = airfoil_analysis[airfoil_name]
 
         # CONFIDENCE alanını ekle
-        airfoil_data['CONFIDENCE'] = analysis_data.get('confidence', 'medium')
+        airfoil_data['CONFIDENCE'] = analysis_data.get('confidence', CONFIDENCE_MEDIUM)
 
         # METHOD bilgisini ekle
         airfoil_data['METHOD'] = analysis_data.get('method', 'computed')
@@ -130,18 +170,33 @@ for airfoil_name, airfoil_data in current_airfoils.items():
                 analysis_data['method']
             )
 
-        print(f"  ✓ {airfoil_name} güncellendi (CONFIDENCE={airfoil_data['CONFIDENCE']})")
+        updated_lines.append(f"  ✓ {airfoil_name} güncellendi (CONFIDENCE={airfoil_data['CONFIDENCE']})")
+
+if updated_lines:
+    sys.stdout.write("\n".join(updated_lines) + "\n")
 
 # ============================================================================
 # 3. METADATA EKLE
 # ============================================================================
 print("\n[3/3] Metadata ekleniyor...")
 
+# Sabit değerler metadata sözlüğünden önce bir kez hesaplanır
+now_iso = datetime.now().isoformat()
+esc_values = current_escs.values()
+airfoil_values = current_airfoils.values()
+n_esc = len(current_escs)
+n_airfoil = len(current_airfoils)
+
+# Doğrulama sayıları: her sözlük tek geçişte sayılır
+# (map + Counter: alan okuma ve sayma C döngüsünde yapılır)
+esc_verified = Counter(map(bool, map(methodcaller('get', 'VERIFIED'), esc_values)))
+airfoil_confidence = Counter(map(methodcaller('get', 'CONFIDENCE'), airfoil_values))
+
 # Veritabanı versiyon bilgisi
 db['_metadata'] = {
-    'version': 'v1.1.0',
+    'version': DB_VERSION,
     'description': 'UAV Database with Validated ESC and Airfoil Data',
-    'date': datetime.now().isoformat(),
+    'date': now_iso,
     'validation_date': '2026-02-24',
     'changes': [
         'ESC: Added VERIFIED field from web scraping validation',
@@ -154,15 +209,15 @@ db['_metadata'] = {
     ],
     'validation_summary': {
         'esc': {
-            'total': len(current_escs),
-            'verified': sum(1 for e in current_escs.values() if e.get('VERIFIED') == True),
-            'unverified': sum(1 for e in current_escs.values() if not e.get('VERIFIED'))
+            'total': n_esc,
+            'verified': esc_verified[True],
+            'unverified': esc_verified[False]
         },
         'airfoil': {
-            'total': len(current_airfoils),
-            'high_confidence': sum(1 for a in current_airfoils.values() if a.get('CONFIDENCE') == 'high'),
-            'medium_confidence': sum(1 for a in current_airfoils.values() if a.get('CONFIDENCE') == 'medium'),
-            'low_confidence': sum(1 for a in current_airfoils.values() if a.get('CONFIDENCE') == 'low')
+            'total': n_airfoil,
+            'high_confidence': airfoil_confidence[CONFIDENCE_HIGH],
+            'medium_confidence': airfoil_confidence[CONFIDENCE_MEDIUM],
+            'low_confidence': airfoil_confidence[CONFIDENCE_LOW]
         }
     },
     'sources': {
@@ -175,29 +230,69 @@ db['_metadata'] = {
 # ============================================================================
 # 4. KAYDET
 # ============================================================================
+
+
+def write_bytes(path, data):
+    """Baytları ham dosya tanımlayıcısına doğrudan yaz (ara tampon yok)"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]  # Kısmi yazmaları tamamla
+    finally:
+        os.close(fd)
+
+
+if GZIP_OUTPUT:
+    output_path = output_path.with_name(output_path.name + '.gz')
+
 print(f"\nKaydediliyor: {output_path}")
-with open(output_path, 'w') as f:
-    json.dump(db, f, indent=2)
+# Dosya programlarca okunur: girintisiz, kompakt JSON yazılır
+if ORJSON_AVAILABLE and not GZIP_OUTPUT:
+    write_bytes(output_path, orjson.dumps(db))
+else:
+    if GZIP_OUTPUT:
+        out_file = gzip.open(output_path, 'wb', compresslevel=1)
+    else:
+        out_file = open(output_path, 'wb', buffering=1 << 20)
+    with out_file as f:
+        if ORJSON_AVAILABLE:
+            f.write(orjson.dumps(db))
+        else:
+            # Parça parça kodla; parçalar tamponda birikip toplu yazılır,
+            # tüm JSON metni bellekte tutulmaz
+            encoder = json.JSONEncoder(separators=(',', ':'))
+            for chunk in encoder.iterencode(db):
+                f.write(chunk.encode('utf-8'))
 
 print("\n✓ Validasyon entegrasyonu tamamlandı!")
 
 # Özet
-print("\n" + "="*60)
-print("ENTEGRASYON ÖZETİ")
-print("="*60)
-print(f"\nESC Modelleri:")
-print(f"  Toplam: {db['_metadata']['validation_summary']['esc']['total']}")
-print(f"  Doğrulanmış: {db['_metadata']['validation_summary']['esc']['verified']}")
-print(f"  Doğrulanmamış: {db['_metadata']['validation_summary']['esc']['unverified']}")
-
-print(f"\nAirfoil Modelleri:")
-print(f"  Toplam: {db['_metadata']['validation_summary']['airfoil']['total']}")
-print(f"  Yüksek güvenilirlik: {db['_metadata']['validation_summary']['airfoil']['high_confidence']}")
-print(f"  Orta güvenilirlik: {db['_metadata']['validation_summary']['airfoil']['medium_confidence']}")
-print(f"  Düşük güvenilirlik: {db['_metadata']['validation_summary']['airfoil']['low_confidence']}")
-
-print(f"\nModel Değişiklikleri:")
-for old, new in db['model_replacements'].items():
-    print(f"  {old} → {new}")
-
-print("\n" + "="*60)
+summary = db['_metadata']['validation_summary']
+esc_sum = summary['esc']
+af_sum = summary['airfoil']
+
+# Rapor tek bir metin olarak oluşturulup tek seferde yazılır
+lines = [
+    "",
+    "=" * 60,
+    "ENTEGRASYON ÖZETİ",
+    "=" * 60,
+    "",
+    "ESC Modelleri:",
+    f"  Toplam: {esc_sum['total']}",
+    f"  Doğrulanmış: {esc_sum['verified']}",
+    f"  Doğrulanmamış: {esc_sum['unverified']}",
+    "",
+    "Airfoil Modelleri:",
+    f"  Toplam: {af_sum['total']}",
+    f"  Yüksek güvenilirlik: {af_sum['high_confidence']}",
+    f"  Orta güvenilirlik: {af_sum['medium_confidence']}",
+    f"  Düşük güvenilirlik: {af_sum['low_confidence']}",
+    "",
+    "Model Değişiklikleri:",
+    *(f"  {old} → {new}" for old, new in db['model_replacements'].items()),
+    "",
+    "=" * 60,
+]
+sys.stdout.write("\n".join(lines) + "\n")